@@ -27,15 +27,24 @@ Usage:
     annotated.save("annotated_screenshot.png")
 """
 
+import functools
 import json
 import math
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from io import BytesIO
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Union
 
 from PIL import Image, ImageDraw, ImageFont
 
+# Optional C JSON codec for registry and annotation I/O; falls back to stdlib json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # =============================================================================
 # TFCU BRAND COLORS
 # =============================================================================
@@ -70,47 +79,77 @@ DEFAULT_STYLE = {
 # =============================================================================
 
 
+_HEX_DIGITS = frozenset("0123456789abcdefABCDEF")
+
+
+@functools.lru_cache(maxsize=64)
 def hex_to_rgb(hex_color: str) -> Tuple[int, int, int]:
-    """Convert hex color to RGB tuple."""
-    hex_color = hex_color.lstrip("#")
-    return tuple(int(hex_color[i : i + 2], 16) for i in (0, 2, 4))
+    """Convert hex color to RGB tuple (cached - only a small palette is used)."""
+    # Only the first six digits count, so "#C00000FF" is still red
+    digits = hex_color.lstrip("#")[:6]
+    if len(digits) != 6 or not _HEX_DIGITS.issuperset(digits):
+        raise ValueError(f"Invalid hex color: {hex_color!r}")
+    value = int(digits, 16)
+    return ((value >> 16) & 0xFF, (value >> 8) & 0xFF, value & 0xFF)
 
 
+@functools.lru_cache(maxsize=64)
 def hex_to_rgba(hex_color: str, alpha: int = 255) -> Tuple[int, int, int, int]:
     """Convert hex color to RGBA tuple."""
     rgb = hex_to_rgb(hex_color)
     return (*rgb, alpha)
 
 
+# Brand colors pre-resolved to RGB tuples (no parsing in the draw loops)
+TFCU_RGB = {name: hex_to_rgb(hex_val) for name, hex_val in TFCU_COLORS.items()}
+
+
 def percent_to_pixels(percent: float, dimension: int) -> int:
     """Convert percentage (0-100) to pixel position."""
     return int((percent / 100) * dimension)
 
 
-def get_font(size: int) -> ImageFont.FreeTypeFont:
-    """Get a font, falling back to default if custom fonts unavailable."""
-    # Try common system fonts in order of preference
-    font_paths = [
-        # Windows
-        "C:/Windows/Fonts/calibri.ttf",
-        "C:/Windows/Fonts/arial.ttf",
-        "C:/Windows/Fonts/segoeui.ttf",
-        # Linux
-        "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
-        "/usr/share/fonts/truetype/liberation/LiberationSans-Regular.ttf",
-        "/usr/share/fonts/TTF/DejaVuSans.ttf",
-        # macOS
-        "/System/Library/Fonts/Helvetica.ttc",
-        "/System/Library/Fonts/SFNSText.ttf",
-        "/Library/Fonts/Arial.ttf",
-    ]
-
-    for font_path in font_paths:
+# Common system fonts in order of preference
+FONT_PATHS = [
+    # Windows
+    "C:/Windows/Fonts/calibri.ttf",
+    "C:/Windows/Fonts/arial.ttf",
+    "C:/Windows/Fonts/segoeui.ttf",
+    # Linux
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
+    "/usr/share/fonts/truetype/liberation/LiberationSans-Regular.ttf",
+    "/usr/share/fonts/TTF/DejaVuSans.ttf",
+    # macOS
+    "/System/Library/Fonts/Helvetica.ttc",
+    "/System/Library/Fonts/SFNSText.ttf",
+    "/Library/Fonts/Arial.ttf",
+]
+
+
+def _find_font_path() -> Optional[str]:
+    """Return the first system font that exists and loads, or None."""
+    for font_path in FONT_PATHS:
         if Path(font_path).exists():
             try:
-                return ImageFont.truetype(font_path, size)
+                ImageFont.truetype(font_path, 10)
             except Exception:
                 continue
+            return font_path
+    return None
+
+
+# Resolved once at import so get_font() never re-probes the filesystem
+_FONT_PATH = _find_font_path()
+
+
+@functools.lru_cache(maxsize=32)
+def get_font(size: int) -> ImageFont.FreeTypeFont:
+    """Get a font (cached per size), falling back to default if unavailable."""
+    if _FONT_PATH:
+        try:
+            return ImageFont.truetype(_FONT_PATH, size)
+        except Exception:
+            pass
 
     # Pillow 10+ has a better default font; try to use it at requested size
     try:
@@ -124,6 +163,13 @@ def get_font(size: int) -> ImageFont.FreeTypeFont:
         return ImageFont.load_default()
 
 
+@functools.lru_cache(maxsize=4096)
+def _text_size(text: str, font: ImageFont.FreeTypeFont) -> Tuple[int, int]:
+    """Measure text (cached per text and font) via the font's own bbox."""
+    left, top, right, bottom = font.getbbox(text)
+    return right - left, bottom - top
+
+
 # =============================================================================
 # IMAGE PREPROCESSING (v4.1)
 # =============================================================================
@@ -157,41 +203,54 @@ class ImagePreprocessor:
             min_width: Minimum acceptable width (will upscale if below)
 
         Returns:
-            Preprocessed PIL Image ready for annotation
+            Preprocessed PIL Image (RGB or RGBA) ready for annotation
         """
-        # 1. Convert to RGBA for consistency
-        if image.mode != "RGBA":
+        # 1. Normalize palette/greyscale modes; RGB is kept as-is since the
+        #    annotator adds the alpha channel itself when compositing
+        if image.mode not in ("RGB", "RGBA"):
             image = image.convert("RGBA")
 
-        # 2. Apply smart crop if suggested
+        # 2. Resolve the crop box (whole image if no crop suggested)
         if suggested_crop:
-            image = self.smart_crop(image, suggested_crop)
+            box = self.crop_box_pixels(image, suggested_crop)
+        else:
+            box = (0, 0, image.width, image.height)
+        box_width = box[2] - box[0]
+        box_height = box[3] - box[1]
 
-        # 3. Resize to target width (preserving aspect ratio)
-        image = self.resize_preserving_aspect(image, target_width)
+        # 3. Target width (preserving aspect ratio)
+        if box_width == target_width:
+            final_size = (box_width, box_height)
+        else:
+            final_size = (target_width, int(target_width * (box_height / box_width)))
 
-        # 4. Upscale if below minimum (using LANCZOS for quality)
-        if image.width < min_width:
-            scale = min_width / image.width
-            new_size = (int(image.width * scale), int(image.height * scale))
-            image = image.resize(new_size, Image.Resampling.LANCZOS)
+        # 4. Upscale if below minimum
+        if final_size[0] < min_width:
+            scale = min_width / final_size[0]
+            final_size = (int(final_size[0] * scale), int(final_size[1] * scale))
 
-        return image
+        # 5. Crop and resize in a single LANCZOS pass (no intermediate crop)
+        if final_size == (box_width, box_height):
+            if box == (0, 0, image.width, image.height):
+                return image
+            return image.crop(box)
 
-    def smart_crop(
+        return image.resize(final_size, Image.Resampling.LANCZOS, box=box)
+
+    def crop_box_pixels(
         self,
         image: Image.Image,
         crop_box: Dict[str, float],
-    ) -> Image.Image:
+    ) -> Tuple[int, int, int, int]:
         """
-        Crop image based on percentage coordinates.
+        Convert percentage crop coordinates to a clamped pixel box.
 
         Args:
             image: Input PIL Image
             crop_box: {"x": left%, "y": top%, "w": width%, "h": height%}
 
         Returns:
-            Cropped PIL Image
+            (left, top, right, bottom) pixel box
         """
         x = int((crop_box["x"] / 100) * image.width)
         y = int((crop_box["y"] / 100) * image.height)
@@ -204,7 +263,24 @@ class ImagePreprocessor:
         right = min(x + w, image.width)
         bottom = min(y + h, image.height)
 
-        return image.crop((x, y, right, bottom))
+        return (x, y, right, bottom)
+
+    def smart_crop(
+        self,
+        image: Image.Image,
+        crop_box: Dict[str, float],
+    ) -> Image.Image:
+        """
+        Crop image based on percentage coordinates.
+
+        Args:
+            image: Input PIL Image
+            crop_box: {"x": left%, "y": top%, "w": width%, "h": height%}
+
+        Returns:
+            Cropped PIL Image
+        """
+        return image.crop(self.crop_box_pixels(image, crop_box))
 
     def resize_preserving_aspect(
         self,
@@ -227,28 +303,49 @@ class ImagePreprocessor:
         self,
         image: Image.Image,
         output_format: str = "PNG",
-    ) -> bytes:
+        compress_level: int = 1,
+        buffer: BytesIO = None,
+    ) -> Union[bytes, memoryview]:
         """
         Save image with maximum quality settings.
 
+        Args:
+            image: PIL Image to encode
+            output_format: "PNG", "JPEG"/"JPG", or any Pillow format
+            compress_level: PNG zlib level (0 = store, fastest; 9 = smallest).
+                PNG is lossless, so this only trades encode time for size.
+            buffer: Optional caller-owned BytesIO to reuse across saves. It is
+                rewound and truncated first; release the returned view before
+                passing the buffer in again.
+
         Returns:
-            Image as bytes
+            Image as bytes, or a zero-copy memoryview of buffer if one was given
         """
-        buffer = BytesIO()
+        reuse = buffer is not None
+        if reuse:
+            buffer.seek(0)
+            buffer.truncate()
+        else:
+            buffer = BytesIO()
 
         if output_format.upper() == "PNG":
             image.save(
                 buffer,
                 format="PNG",
                 dpi=(self.target_dpi, self.target_dpi),
-                compress_level=1,  # Minimal compression for quality
+                compress_level=compress_level,
             )
         elif output_format.upper() in ("JPEG", "JPG"):
             # Convert to RGB for JPEG (no alpha)
             if image.mode == "RGBA":
-                rgb_image = Image.new("RGB", image.size, (255, 255, 255))
-                rgb_image.paste(image, mask=image.split()[3])
-                image = rgb_image
+                alpha_min, _ = image.getextrema()[3]
+                if alpha_min == 255:
+                    # Fully opaque - just drop the alpha channel
+                    image = image.convert("RGB")
+                else:
+                    rgb_image = Image.new("RGB", image.size, (255, 255, 255))
+                    rgb_image.paste(image, mask=image.split()[3])
+                    image = rgb_image
             image.save(
                 buffer,
                 format="JPEG",
@@ -259,7 +356,7 @@ class ImagePreprocessor:
         else:
             image.save(buffer, format=output_format)
 
-        return buffer.getvalue()
+        return buffer.getbuffer() if reuse else buffer.getvalue()
 
 
 # =============================================================================
@@ -432,13 +529,12 @@ def draw_legend(
     # Calculate legend dimensions
     font = get_font(style["legend_font_size"])
     title_font = get_font(style["legend_title_size"])
+    num_font = get_font(style["legend_font_size"] - 1)
 
-    # Find max text width
-    max_text_width = 0
-    for entry in legend_entries:
-        text_bbox = font.getbbox(entry.get("text", ""))
-        text_width = text_bbox[2] - text_bbox[0] if text_bbox else 0
-        max_text_width = max(max_text_width, text_width)
+    # Find max text width (advance width only - no vertical metrics needed)
+    max_text_width = math.ceil(
+        max(font.getlength(entry.get("text", "")) for entry in legend_entries)
+    )
 
     legend_width = min(
         padding * 2 + circle_radius * 2 + 10 + max_text_width + 20, image.width - 20
@@ -486,7 +582,7 @@ def draw_legend(
     draw.text(
         (legend_x + padding, title_y),
         "Annotation Key:",
-        fill=hex_to_rgb(TFCU_COLORS["primary"]),
+        fill=TFCU_RGB["primary"],
         font=title_font,
     )
 
@@ -514,10 +610,7 @@ def draw_legend(
 
         # Number in circle
         number_text = str(entry["number"])
-        num_font = get_font(style["legend_font_size"] - 1)
-        num_bbox = draw.textbbox((0, 0), number_text, font=num_font)
-        num_width = num_bbox[2] - num_bbox[0]
-        num_height = num_bbox[3] - num_bbox[1]
+        num_width, num_height = _text_size(number_text, num_font)
 
         draw.text(
             (circle_x - num_width // 2, circle_y - num_height // 2 - 1),
@@ -554,6 +647,7 @@ def draw_callout(
     number: int,
     color: str = None,
     style: Dict = None,
+    font: ImageFont.FreeTypeFont = None,
 ) -> None:
     """
     Draw a numbered callout (circled number) at the specified position.
@@ -565,6 +659,7 @@ def draw_callout(
         number: Number to display (1-99)
         color: Hex color for the callout circle
         style: Style overrides
+        font: Pre-resolved number font (defaults to callout_font_size)
     """
     style = {**DEFAULT_STYLE, **(style or {})}
     color = color or TFCU_COLORS["critical"]
@@ -577,23 +672,20 @@ def draw_callout(
 
     # Draw filled circle
     bbox = [x - radius, y - radius, x + radius, y + radius]
-    draw.ellipse(
-        bbox, fill=hex_to_rgb(color), outline=hex_to_rgb(TFCU_COLORS["white"]), width=2
-    )
+    draw.ellipse(bbox, fill=hex_to_rgb(color), outline=TFCU_RGB["white"], width=2)
 
     # Draw number
-    font = get_font(style["callout_font_size"])
+    if font is None:
+        font = get_font(style["callout_font_size"])
     text = str(number)
 
     # Get text bounding box for centering
-    text_bbox = draw.textbbox((0, 0), text, font=font)
-    text_width = text_bbox[2] - text_bbox[0]
-    text_height = text_bbox[3] - text_bbox[1]
+    text_width, text_height = _text_size(text, font)
 
     text_x = x - text_width // 2
     text_y = y - text_height // 2 - 2  # Slight adjustment for visual centering
 
-    draw.text((text_x, text_y), text, fill=hex_to_rgb(TFCU_COLORS["white"]), font=font)
+    draw.text((text_x, text_y), text, fill=TFCU_RGB["white"], font=font)
 
 
 def draw_arrow(
@@ -626,6 +718,10 @@ def draw_arrow(
     x2 = percent_to_pixels(end["x"], image.width)
     y2 = percent_to_pixels(end["y"], image.height)
 
+    # A zero-length arrow has no direction to point in; draw nothing
+    if x1 == x2 and y1 == y2:
+        return
+
     rgb_color = hex_to_rgb(color)
     line_width = style["arrow_width"]
     head_size = style["arrow_head_size"]
@@ -639,6 +735,16 @@ def draw_arrow(
         _draw_arrowhead(draw, x1, y1, x2, y2, rgb_color, head_size)
 
 
+@functools.lru_cache(maxsize=64)
+def _bezier_weights(samples: int) -> Tuple[Tuple[float, float, float], ...]:
+    """Quadratic bezier basis weights ((1-t)^2, 2(1-t)t, t^2) for evenly spaced t."""
+    step = samples - 1
+    return tuple(
+        ((1 - t) ** 2, 2 * (1 - t) * t, t**2)
+        for t in (i / step for i in range(samples))
+    )
+
+
 def _draw_curved_arrow(
     draw: ImageDraw.ImageDraw,
     x1: int,
@@ -657,34 +763,34 @@ def _draw_curved_arrow(
     # Perpendicular offset
     dx = x2 - x1
     dy = y2 - y1
-    length = math.sqrt(dx * dx + dy * dy)
-
-    if length == 0:
-        return
+    length = math.sqrt(dx * dx + dy * dy)  # non-zero, checked by draw_arrow
 
     # Offset control point perpendicular to the line
     offset = length * 0.2  # 20% curve
     ctrl_x = mid_x - (dy / length) * offset
     ctrl_y = mid_y + (dx / length) * offset
 
-    # Draw bezier curve as line segments
-    points = []
-    for t in [i / 20 for i in range(21)]:
-        # Quadratic bezier formula
-        px = (1 - t) ** 2 * x1 + 2 * (1 - t) * t * ctrl_x + t**2 * x2
-        py = (1 - t) ** 2 * y1 + 2 * (1 - t) * t * ctrl_y + t**2 * y2
-        points.append((px, py))
+    # Curvature is fixed at 20%, so chord length alone decides how many
+    # segments keep the curve smooth: ~one per 20px, between 8 and 64
+    samples = min(64, max(8, int(length / 20)))
+    points = [
+        (a * x1 + b * ctrl_x + c * x2, a * y1 + b * ctrl_y + c * y2)
+        for a, b, c in _bezier_weights(samples)
+    ]
+
+    # Draw the curve as one connected polyline (rounded joins between segments)
+    draw.line(points, fill=color, width=width, joint="curve")
 
-    # Draw the curve
-    for i in range(len(points) - 1):
-        draw.line([points[i], points[i + 1]], fill=color, width=width)
+    # Aim the arrowhead along the chord from t=0.9 to the tip, independent of
+    # the sample count
+    prev_x = 0.01 * x1 + 0.18 * ctrl_x + 0.81 * x2
+    prev_y = 0.01 * y1 + 0.18 * ctrl_y + 0.81 * y2
+    _draw_arrowhead(draw, prev_x, prev_y, x2, y2, color, head_size)
 
-    # Draw arrowhead at the end
-    # Calculate angle from second-to-last point to last point
-    if len(points) >= 2:
-        last_x, last_y = points[-1]
-        prev_x, prev_y = points[-3] if len(points) >= 3 else points[-2]
-        _draw_arrowhead(draw, prev_x, prev_y, last_x, last_y, color, head_size)
+
+# Arrowhead half-angle (30 degrees), as cos/sin for rotating the arrow direction
+_ARROWHEAD_COS = math.cos(math.pi / 6)
+_ARROWHEAD_SIN = math.sin(math.pi / 6)
 
 
 def _draw_arrowhead(
@@ -697,22 +803,92 @@ def _draw_arrowhead(
     size: int,
 ) -> None:
     """Draw an arrowhead at (x2, y2) pointing from (x1, y1)."""
-    angle = math.atan2(y2 - y1, x2 - x1)
-    arrow_angle = math.pi / 6  # 30 degrees
+    # Unit direction; a zero-length arrow points right (same as atan2(0, 0))
+    dx = x2 - x1
+    dy = y2 - y1
+    length = math.hypot(dx, dy)
+    if length:
+        ux, uy = dx / length, dy / length
+    else:
+        ux, uy = 1.0, 0.0
 
-    # Calculate arrowhead points
-    p1 = (
-        x2 - size * math.cos(angle - arrow_angle),
-        y2 - size * math.sin(angle - arrow_angle),
-    )
-    p2 = (
-        x2 - size * math.cos(angle + arrow_angle),
-        y2 - size * math.sin(angle + arrow_angle),
-    )
+    # Rotate the reversed direction by +/-30 degrees (no per-arrow trig)
+    cos_a = _ARROWHEAD_COS * size
+    sin_a = _ARROWHEAD_SIN * size
+    p1 = (x2 - (ux * cos_a + uy * sin_a), y2 - (uy * cos_a - ux * sin_a))
+    p2 = (x2 - (ux * cos_a - uy * sin_a), y2 - (uy * cos_a + ux * sin_a))
 
     draw.polygon([(x2, y2), p1, p2], fill=color)
 
 
+def draw_callout_arrow(
+    draw: ImageDraw.ImageDraw,
+    image: Image.Image,
+    start: Dict[str, float],
+    position: Dict[str, float],
+    number: int,
+    color: str = None,
+    style: Dict = None,
+    font: ImageFont.FreeTypeFont = None,
+    curved: bool = True,
+) -> None:
+    """
+    Draw an arrow from start to a numbered callout, stopping at the circle edge.
+
+    Args:
+        draw: ImageDraw object
+        image: PIL Image for dimensions
+        start: {"x": 0-100, "y": 0-100} arrow tail
+        position: {"x": 0-100, "y": 0-100} callout center
+        number: Number to display (1-99)
+        color: Hex color shared by the arrow and callout circle
+        style: Style overrides
+        font: Pre-resolved number font (defaults to callout_font_size)
+        curved: If True, draw a curved arrow; otherwise straight
+    """
+    style = {**DEFAULT_STYLE, **(style or {})}
+    color = color or TFCU_COLORS["critical"]
+
+    # Convert percentage to pixels
+    sx = percent_to_pixels(start["x"], image.width)
+    sy = percent_to_pixels(start["y"], image.height)
+    cx = percent_to_pixels(position["x"], image.width)
+    cy = percent_to_pixels(position["y"], image.height)
+
+    # Pull the arrow tip back from the callout center to its edge; a tail
+    # inside the circle leaves nothing to draw but the callout itself
+    radius = style["callout_radius"]
+    dx = cx - sx
+    dy = cy - sy
+    length = math.hypot(dx, dy)
+    if length > radius:
+        scale = radius / length
+        end_x = cx - dx * scale
+        end_y = cy - dy * scale
+
+        rgb_color = hex_to_rgb(color)
+        line_width = style["arrow_width"]
+        head_size = style["arrow_head_size"]
+        if curved:
+            _draw_curved_arrow(
+                draw, sx, sy, end_x, end_y, rgb_color, line_width, head_size
+            )
+        else:
+            draw.line([(sx, sy), (end_x, end_y)], fill=rgb_color, width=line_width)
+            _draw_arrowhead(draw, sx, sy, end_x, end_y, rgb_color, head_size)
+
+    # Callout last so it sits on top of the arrow
+    draw_callout(
+        draw,
+        image,
+        position=position,
+        number=number,
+        color=color,
+        style=style,
+        font=font,
+    )
+
+
 def draw_highlight(
     draw: ImageDraw.ImageDraw,
     image: Image.Image,
@@ -730,10 +906,11 @@ def draw_highlight(
         bbox: {"x": 0-100, "y": 0-100, "w": width%, "h": height%}
         color: Hex color for the highlight
         style: Style overrides
-        overlay_image: Image to composite highlight onto
+        overlay_image: Image to composite highlight onto (defaults to image)
 
     Returns:
-        Modified image with highlight
+        Image with highlight. RGBA targets are modified in place and returned;
+        other modes are converted to a new RGBA image first.
     """
     style = {**DEFAULT_STYLE, **(style or {})}
     color = color or TFCU_COLORS["warning"]
@@ -744,28 +921,52 @@ def draw_highlight(
     w = percent_to_pixels(bbox["w"], image.width)
     h = percent_to_pixels(bbox["h"], image.height)
 
-    # Create transparent overlay
-    overlay = Image.new("RGBA", image.size, (0, 0, 0, 0))
-    overlay_draw = ImageDraw.Draw(overlay)
+    # Composite target - callers like process_image already hold RGBA
+    base = overlay_image if overlay_image is not None else image
+    if base.mode != "RGBA":
+        base = base.convert("RGBA")
+
+    # Zero-area boxes would render as a stray border-only sliver
+    if w <= 0 or h <= 0:
+        return base
+
+    # Overlay covers only the highlight box plus border, clipped to the image
+    border_width = style["border_width"]
+    left, top = max(x - border_width, 0), max(y - border_width, 0)
+    right = min(x + w + border_width + 1, image.width)
+    bottom = min(y + h + border_width + 1, image.height)
+    if right <= left or bottom <= top:
+        return base
 
     # Calculate alpha from opacity
     alpha = int(255 * style["highlight_opacity"])
-    fill_color = hex_to_rgba(color, alpha)
     border_color = hex_to_rgb(color)
 
-    # Draw filled rectangle with transparency
+    # Opaque highlights need no blending - draw straight onto the target
+    if alpha >= 255:
+        ImageDraw.Draw(base).rectangle(
+            [(x, y), (x + w, y + h)],
+            fill=hex_to_rgba(color, 255),
+            outline=border_color,
+            width=border_width,
+        )
+        return base
+
+    fill_color = hex_to_rgba(color, alpha)
+    overlay = Image.new("RGBA", (right - left, bottom - top), (0, 0, 0, 0))
+    overlay_draw = ImageDraw.Draw(overlay)
+
+    # Draw filled rectangle with transparency (overlay-local coordinates)
     overlay_draw.rectangle(
-        [(x, y), (x + w, y + h)],
+        [(x - left, y - top), (x - left + w, y - top + h)],
         fill=fill_color,
         outline=border_color,
-        width=style["border_width"],
+        width=border_width,
     )
 
-    # Composite overlay onto image
-    if overlay_image is not None:
-        return Image.alpha_composite(overlay_image.convert("RGBA"), overlay)
-    else:
-        return Image.alpha_composite(image.convert("RGBA"), overlay)
+    # Composite just the box region onto the image
+    base.alpha_composite(overlay, dest=(left, top))
+    return base
 
 
 def draw_circle(
@@ -793,6 +994,8 @@ def draw_circle(
     x = percent_to_pixels(position["x"], image.width)
     y = percent_to_pixels(position["y"], image.height)
     radius = percent_to_pixels(radius_percent, image.width)
+    if radius <= 0:
+        return
 
     bbox = [x - radius, y - radius, x + radius, y + radius]
     draw.ellipse(bbox, outline=hex_to_rgb(color), width=style["border_width"])
@@ -806,6 +1009,7 @@ def draw_label(
     color: str = None,
     bg_color: str = None,
     style: Dict = None,
+    font: ImageFont.FreeTypeFont = None,
 ) -> None:
     """
     Draw a text label with background.
@@ -818,6 +1022,7 @@ def draw_label(
         color: Text color (hex)
         bg_color: Background color (hex)
         style: Style overrides
+        font: Pre-resolved label font (defaults to label_font_size)
     """
     style = {**DEFAULT_STYLE, **(style or {})}
     color = color or TFCU_COLORS["white"]
@@ -826,7 +1031,8 @@ def draw_label(
     x = percent_to_pixels(position["x"], image.width)
     y = percent_to_pixels(position["y"], image.height)
 
-    font = get_font(style["label_font_size"])
+    if font is None:
+        font = get_font(style["label_font_size"])
     padding = style["label_padding"]
 
     # Get text size
@@ -879,11 +1085,18 @@ class FigureRegistry:
         "orange": "#ED7D31",
     }
 
+    # Reverse lookup for hex input; the first palette name listed for a hex
+    # wins (e.g. "red" over "critical"), matching the palette order
+    _HEX_TO_NAME = {v.lower(): k for k, v in reversed(COLOR_PALETTE.items())}
+
     def __init__(self):
         """Initialize empty figure registry."""
         self.figures = []
         self._next_number = 1
         self.color_map = {}  # {figure_number: {annotation_number: color_name}}
+        # Lookup indexes over self.figures, maintained by add_figure
+        self._by_number: Dict[int, Dict] = {}
+        self._by_section: Dict[str, List[Dict]] = {}
 
     def add_figure(
         self,
@@ -939,6 +1152,8 @@ class FigureRegistry:
         }
 
         self.figures.append(figure_data)
+        self._by_number[figure_num] = figure_data
+        self._by_section.setdefault(figure_data["section"], []).append(figure_data)
         return figure_num
 
     def _normalize_color(self, color: str) -> str:
@@ -948,22 +1163,16 @@ class FigureRegistry:
         color_lower = color.lower().strip()
         # Handle hex colors
         if color_lower.startswith("#"):
-            for name, hex_val in self.COLOR_PALETTE.items():
-                if hex_val.lower() == color_lower:
-                    return name
-            return color_lower
+            return self._HEX_TO_NAME.get(color_lower, color_lower)
         return color_lower if color_lower in self.COLOR_PALETTE else "teal"
 
     def get_figure(self, figure_num: int) -> Optional[Dict]:
         """Get figure metadata by figure number."""
-        for fig in self.figures:
-            if fig["figure_number"] == figure_num:
-                return fig
-        return None
+        return self._by_number.get(figure_num)
 
     def get_figures_by_section(self, section: str) -> List[Dict]:
         """Get all figures for a specific section."""
-        return [fig for fig in self.figures if fig["section"] == section]
+        return list(self._by_section.get(section, ()))
 
     def to_json(self) -> Dict:
         """
@@ -983,6 +1192,15 @@ class FigureRegistry:
     def save(self, output_path: Union[str, Path]):
         """Save registry to JSON file."""
         output_path = Path(output_path)
+        if orjson is not None:
+            # color_map is keyed by int figure numbers, hence OPT_NON_STR_KEYS
+            output_path.write_bytes(
+                orjson.dumps(
+                    self.to_json(),
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+                )
+            )
+            return
         with open(output_path, "w", encoding="utf-8") as f:
             json.dump(self.to_json(), f, indent=2, ensure_ascii=False)
 
@@ -1019,6 +1237,83 @@ class ScreenshotAnnotator:
     def __init__(self, style_overrides: Dict = None):
         """Initialize with optional style overrides."""
         self.style = {**DEFAULT_STYLE, **(style_overrides or {})}
+        self._dispatch = {
+            "callout": self._draw_callout,
+            "arrow": self._draw_arrow,
+            "highlight": self._draw_highlight,
+            "circle": self._draw_circle,
+            "label": self._draw_label,
+            "callout_arrow": self._draw_callout_arrow,
+        }
+
+    # Annotation handlers, dispatched by type from process_image
+
+    def _draw_callout(self, draw, image, annotation, fonts):
+        draw_callout(
+            draw,
+            image,
+            position=annotation["position"],
+            number=annotation.get("number", 1),
+            color=annotation.get("color"),
+            style=self.style,
+            font=fonts["callout"],
+        )
+
+    def _draw_arrow(self, draw, image, annotation, fonts):
+        draw_arrow(
+            draw,
+            image,
+            start=annotation["position"],
+            end=annotation["end"],
+            color=annotation.get("color"),
+            style=self.style,
+            curved=annotation.get("curved", True),
+        )
+
+    def _draw_callout_arrow(self, draw, image, annotation, fonts):
+        draw_callout_arrow(
+            draw,
+            image,
+            start=annotation["start"],
+            position=annotation["position"],
+            number=annotation.get("number", 1),
+            color=annotation.get("color"),
+            style=self.style,
+            font=fonts["callout"],
+            curved=annotation.get("curved", True),
+        )
+
+    def _draw_highlight(self, draw, image, annotation, fonts):
+        # Composites in place on the RGBA image, so draw stays valid
+        draw_highlight(
+            draw,
+            image,
+            bbox=annotation["bbox"],
+            color=annotation.get("color"),
+            style=self.style,
+        )
+
+    def _draw_circle(self, draw, image, annotation, fonts):
+        draw_circle(
+            draw,
+            image,
+            position=annotation["position"],
+            radius_percent=annotation.get("radius", 5),
+            color=annotation.get("color"),
+            style=self.style,
+        )
+
+    def _draw_label(self, draw, image, annotation, fonts):
+        draw_label(
+            draw,
+            image,
+            position=annotation["position"],
+            text=annotation["text"],
+            color=annotation.get("color"),
+            bg_color=annotation.get("bg_color"),
+            style=self.style,
+            font=fonts["label"],
+        )
 
     def process_image(
         self,
@@ -1051,64 +1346,17 @@ class ScreenshotAnnotator:
         # Create drawing context
         draw = ImageDraw.Draw(image)
 
-        # Process each annotation
-        for annotation in annotations:
-            ann_type = annotation.get("type", "").lower()
-            color = annotation.get("color")
-
-            if ann_type == "callout":
-                draw_callout(
-                    draw,
-                    image,
-                    position=annotation["position"],
-                    number=annotation.get("number", 1),
-                    color=color,
-                    style=self.style,
-                )
-
-            elif ann_type == "arrow":
-                draw_arrow(
-                    draw,
-                    image,
-                    start=annotation["position"],
-                    end=annotation["end"],
-                    color=color,
-                    style=self.style,
-                    curved=annotation.get("curved", True),
-                )
-
-            elif ann_type == "highlight":
-                image = draw_highlight(
-                    draw,
-                    image,
-                    bbox=annotation["bbox"],
-                    color=color,
-                    style=self.style,
-                    overlay_image=image,
-                )
-                # Recreate draw context for modified image
-                draw = ImageDraw.Draw(image)
-
-            elif ann_type == "circle":
-                draw_circle(
-                    draw,
-                    image,
-                    position=annotation["position"],
-                    radius_percent=annotation.get("radius", 5),
-                    color=color,
-                    style=self.style,
-                )
+        # Per-image font state, resolved once rather than per annotation
+        fonts = {
+            "callout": get_font(self.style["callout_font_size"]),
+            "label": get_font(self.style["label_font_size"]),
+        }
 
-            elif ann_type == "label":
-                draw_label(
-                    draw,
-                    image,
-                    position=annotation["position"],
-                    text=annotation["text"],
-                    color=color,
-                    bg_color=annotation.get("bg_color"),
-                    style=self.style,
-                )
+        # Process each annotation; unknown types are ignored
+        for annotation in annotations:
+            handler = self._dispatch.get(annotation.get("type", "").lower())
+            if handler:
+                handler(draw, image, annotation, fonts)
 
         return image
 
@@ -1117,6 +1365,7 @@ class ScreenshotAnnotator:
         image_input: Union[str, Path, bytes, Image.Image],
         annotations: List[Dict],
         output_format: str = "PNG",
+        compress_level: int = 1,
     ) -> bytes:
         """
         Process an image and return as bytes.
@@ -1125,6 +1374,7 @@ class ScreenshotAnnotator:
             image_input: Path to image, bytes, or PIL Image
             annotations: List of annotation dictionaries
             output_format: Output format (PNG recommended)
+            compress_level: PNG zlib level (1 = fast, 9 = smallest)
 
         Returns:
             Annotated image as bytes
@@ -1132,7 +1382,12 @@ class ScreenshotAnnotator:
         image = self.process_image(image_input, annotations, output_format)
 
         buffer = BytesIO()
-        image.save(buffer, format=output_format)
+        if output_format.upper() == "PNG":
+            image.save(
+                buffer, format="PNG", compress_level=compress_level, optimize=False
+            )
+        else:
+            image.save(buffer, format=output_format)
         return buffer.getvalue()
 
 
@@ -1141,7 +1396,11 @@ class ScreenshotAnnotator:
 # =============================================================================
 
 
-def process_from_stdin():
+# Raw bytes per base64 chunk when streaming images to stdout (multiple of 3)
+_B64_CHUNK = 3 * 64 * 1024
+
+
+def process_from_stdin(png_compress_level: int = 1):
     """
     Process annotations from stdin JSON input (legacy mode).
 
@@ -1158,7 +1417,10 @@ def process_from_stdin():
     import base64
 
     # Read JSON from stdin
-    input_data = json.load(sys.stdin)
+    if orjson is not None:
+        input_data = orjson.loads(sys.stdin.buffer.read())
+    else:
+        input_data = json.load(sys.stdin)
 
     # Load image
     if "image_path" in input_data:
@@ -1174,14 +1436,25 @@ def process_from_stdin():
 
     # Output
     if "output_path" in input_data:
-        result.save(input_data["output_path"])
+        result.save(input_data["output_path"], compress_level=png_compress_level)
         print(json.dumps({"success": True, "output_path": input_data["output_path"]}))
     else:
-        # Return as base64
+        # Return as base64, streamed in chunks so the full encoded string is
+        # never held in memory. Chunks are a multiple of 3 bytes, so they
+        # concatenate to exactly the one-shot encoding; the base64 alphabet
+        # needs no JSON escaping.
         buffer = BytesIO()
-        result.save(buffer, format="PNG")
-        b64 = base64.b64encode(buffer.getvalue()).decode("utf-8")
-        print(json.dumps({"success": True, "image_base64": b64}))
+        result.save(buffer, format="PNG", compress_level=png_compress_level)
+        png = buffer.getbuffer()
+        out = sys.stdout
+        out.write('{"success": true, "image_base64": "')
+        for start in range(0, len(png), _B64_CHUNK):
+            out.write(base64.b64encode(png[start : start + _B64_CHUNK]).decode("ascii"))
+        out.write('"}\n')
+
+
+# Image types process_directory picks up (matched case-insensitively)
+SUPPORTED_IMAGE_SUFFIXES = (".png", ".jpg", ".jpeg", ".gif")
 
 
 def process_directory(
@@ -1190,6 +1463,7 @@ def process_directory(
     annotations_map: Dict[str, List[Dict]],
     registry: FigureRegistry,
     color_manager: AnnotationColorManager = None,
+    png_compress_level: int = 1,
 ) -> None:
     """
     Process all images in a directory with batch annotation.
@@ -1200,43 +1474,26 @@ def process_directory(
         annotations_map: Dict mapping image stem to annotation list
         registry: FigureRegistry to track all figures
         color_manager: Optional shared color manager
+        png_compress_level: zlib level for saved figures (1 = fast, 9 = smallest)
     """
     if color_manager is None:
         color_manager = AnnotationColorManager()
 
-    annotator = ScreenshotAnnotator()
-    preprocessor = ImagePreprocessor()
-
-    # Process images (multiple formats supported)
-    supported_extensions = [
-        "*.png",
-        "*.jpg",
-        "*.jpeg",
-        "*.gif",
-        "*.PNG",
-        "*.JPG",
-        "*.JPEG",
-        "*.GIF",
-    ]
-    image_files = []
-    for ext in supported_extensions:
-        image_files.extend(input_dir.glob(ext))
-    # Remove duplicates (case-insensitive filesystems) and sort by name
-    seen = set()
-    unique_files = []
-    for f in sorted(image_files, key=lambda p: p.name.lower()):
-        if f.name.lower() not in seen:
-            seen.add(f.name.lower())
-            unique_files.append(f)
-    image_files = unique_files
+    # One directory scan, classified by lowercased suffix (multiple formats
+    # supported, any case)
+    with os.scandir(input_dir) as entries:
+        files = [
+            (entry.path, entry.name.lower()) for entry in entries if entry.is_file()
+        ]
+    image_files = sorted(
+        (Path(path) for path, name in files if name.endswith(SUPPORTED_IMAGE_SUFFIXES)),
+        key=lambda p: p.name.lower(),
+    )
 
     # Check for unsupported formats and warn
-    wmf_emf_files = (
-        list(input_dir.glob("*.wmf"))
-        + list(input_dir.glob("*.emf"))
-        + list(input_dir.glob("*.WMF"))
-        + list(input_dir.glob("*.EMF"))
-    )
+    wmf_emf_files = [
+        Path(path) for path, name in files if name.endswith((".wmf", ".emf"))
+    ]
     if wmf_emf_files:
         print(
             f"WARNING: Found {len(wmf_emf_files)} WMF/EMF files that cannot be processed."
@@ -1256,7 +1513,11 @@ def process_directory(
 
     print(f"Processing {len(image_files)} images from {input_dir}")
 
-    for img_path in image_files:
+    # Resolve annotations, colors and legends serially so the shared color
+    # manager and figure numbering stay deterministic; only rendering and
+    # saving are farmed out to worker processes
+    jobs = []
+    for offset, img_path in enumerate(image_files):
         img_stem = img_path.stem
         annotations = annotations_map.get(img_stem, [])
 
@@ -1275,18 +1536,10 @@ def process_directory(
                 f"  WARNING: No annotations defined for {img_path.name}, using placeholder"
             )
 
-        # Load and preprocess image
-        image = Image.open(img_path)
-        # Note: preprocessing with crop/resize should be applied if needed
-        # For now, using images as-is
-
-        # Apply annotations
-        annotated = annotator.process_image(image, annotations)
-
-        # Extract legend items from callout annotations
+        # Extract legend items from numbered callout annotations
         legend_items = []
         for ann in annotations:
-            if ann.get("type") == "callout":
+            if ann.get("type") in ("callout", "callout_arrow"):
                 num = ann.get("number", 1)
                 desc = ann.get("description", f"Action {num}")
                 color = ann.get("color", "primary")
@@ -1299,24 +1552,55 @@ def process_directory(
                     }
                 )
 
-        # Add legend if we have callouts
-        if legend_items:
-            annotated = draw_legend(annotated, legend_items, position="bottom")
-
-        # Save annotated image
-        output_path = output_dir / f"figure_{registry._next_number:02d}_{img_stem}.png"
-        annotated.save(output_path, "PNG")
-
-        # Register figure
-        figure_num = registry.add_figure(
-            source_path=img_path,
-            annotated_path=output_path,
-            annotations=annotations,
-            legend_items=legend_items,
-            dimensions={"width": annotated.width, "height": annotated.height},
+        # Figure numbers are pre-assigned so workers can name files up front
+        figure_hint = registry._next_number + offset
+        output_path = output_dir / f"figure_{figure_hint:02d}_{img_stem}.png"
+        jobs.append(
+            (img_path, annotations, legend_items, output_path, png_compress_level)
         )
 
-        print(f"  ✓ Figure {figure_num}: {img_path.name} -> {output_path.name}")
+    max_workers = min(os.cpu_count() or 1, len(jobs))
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        # map() yields in submission order, so figures register in file order
+        for job, (width, height) in zip(jobs, executor.map(_render_figure, jobs)):
+            img_path, annotations, legend_items, output_path, _ = job
+            figure_num = registry.add_figure(
+                source_path=img_path,
+                annotated_path=output_path,
+                annotations=annotations,
+                legend_items=legend_items,
+                dimensions={"width": width, "height": height},
+            )
+
+            print(f"  ✓ Figure {figure_num}: {img_path.name} -> {output_path.name}")
+
+
+def _render_figure(
+    job: Tuple[Path, List[Dict], List[Dict], Path, int],
+) -> Tuple[int, int]:
+    """
+    Annotate one image, add its legend and save it (process_directory worker).
+
+    Returns:
+        (width, height) of the saved figure
+    """
+    img_path, annotations, legend_items, output_path, compress_level = job
+
+    # Load image
+    # Note: preprocessing with crop/resize should be applied if needed
+    # For now, using images as-is
+    image = Image.open(img_path)
+
+    # Apply annotations
+    annotated = ScreenshotAnnotator().process_image(image, annotations)
+
+    # Add legend if we have callouts
+    if legend_items:
+        annotated = draw_legend(annotated, legend_items, position="bottom")
+
+    # Save annotated image
+    annotated.save(output_path, "PNG", compress_level=compress_level)
+    return annotated.width, annotated.height
 
 
 def check_dependencies():
@@ -1335,6 +1619,18 @@ def check_dependencies():
         print("=" * 60)
         sys.exit(1)
 
+    # JPEG decode dominates batch runs; plain libjpeg is several times slower
+    # than libjpeg-turbo. Warn on stderr so stdout stays clean for base64 output.
+    from PIL import features
+
+    if features.check_feature("libjpeg_turbo") is False:
+        print(
+            "WARNING: Pillow is built against plain libjpeg, not libjpeg-turbo;\n"
+            "         JPEG screenshots will decode slowly. Official Pillow wheels\n"
+            "         bundle libjpeg-turbo: pip install --force-reinstall pillow",
+            file=sys.stderr,
+        )
+
 
 def main():
     """Main CLI entry point with batch processing support."""
@@ -1394,12 +1690,20 @@ Examples:
         type=str,
         help="v4.3: Generate HTML color consistency report to this file",
     )
+    parser.add_argument(
+        "--png-compress-level",
+        type=int,
+        default=1,
+        choices=range(10),
+        metavar="0-9",
+        help="zlib level for output PNGs: 1 (default) is fastest, 9 is smallest for final publishing",
+    )
 
     args = parser.parse_args()
 
     # Legacy stdin mode
     if args.stdin:
-        process_from_stdin()
+        process_from_stdin(args.png_compress_level)
         return
 
     # Batch processing mode
@@ -1423,8 +1727,11 @@ Examples:
     if args.annotations:
         annotations_path = Path(args.annotations)
         if annotations_path.exists():
-            with open(annotations_path, encoding="utf-8") as f:
-                annotations_map = json.load(f)
+            if orjson is not None:
+                annotations_map = orjson.loads(annotations_path.read_bytes())
+            else:
+                with open(annotations_path, encoding="utf-8") as f:
+                    annotations_map = json.load(f)
             print(f"Loaded annotations for {len(annotations_map)} images")
         else:
             print(f"WARNING: Annotations file not found: {annotations_path}")
@@ -1442,9 +1749,21 @@ Examples:
     # v4.3: Guided review workflow
     if args.review and annotations_map:
         approved_annotations = guided_review_workflow(annotations_map, input_dir)
-        process_directory(input_dir, output_dir, approved_annotations, registry)
+        process_directory(
+            input_dir,
+            output_dir,
+            approved_annotations,
+            registry,
+            png_compress_level=args.png_compress_level,
+        )
     else:
-        process_directory(input_dir, output_dir, annotations_map, registry)
+        process_directory(
+            input_dir,
+            output_dir,
+            annotations_map,
+            registry,
+            png_compress_level=args.png_compress_level,
+        )
 
     # Save registry
     registry_path = output_dir / "figure_registry.json"
@@ -1468,6 +1787,47 @@ Examples:
 # =============================================================================
 
 
+def _describe_callout(ann: Dict, color: str, pos: Dict) -> str:
+    num = ann.get("number", "?")
+    return f"Callout #{num} ({color}) at ({pos.get('x', '?')}%, {pos.get('y', '?')}%)"
+
+
+def _describe_callout_arrow(ann: Dict, color: str, pos: Dict) -> str:
+    num = ann.get("number", "?")
+    start = ann.get("start", {})
+    return f"Callout #{num} ({color}) at ({pos.get('x', '?')}%, {pos.get('y', '?')}%) with arrow from ({start.get('x')}%, {start.get('y')}%)"
+
+
+def _describe_arrow(ann: Dict, color: str, pos: Dict) -> str:
+    end = ann.get("end", {})
+    return f"Arrow ({color}) from ({pos.get('x')}%, {pos.get('y')}%) to ({end.get('x')}%, {end.get('y')}%)"
+
+
+def _describe_highlight(ann: Dict, color: str, pos: Dict) -> str:
+    bbox = ann.get("bbox", {})
+    return f"Highlight ({color}) box at ({bbox.get('x')}%, {bbox.get('y')}%) size {bbox.get('w')}x{bbox.get('h')}%"
+
+
+def _describe_circle(ann: Dict, color: str, pos: Dict) -> str:
+    return f"Circle ({color}) at ({pos.get('x')}%, {pos.get('y')}%)"
+
+
+def _describe_label(ann: Dict, color: str, pos: Dict) -> str:
+    text = ann.get("text", "")
+    return f"Label ({color}): \"{text}\" at ({pos.get('x')}%, {pos.get('y')}%)"
+
+
+# One-line review summaries by annotation type (guided_review_workflow)
+_REVIEW_DESCRIBERS = {
+    "callout": _describe_callout,
+    "arrow": _describe_arrow,
+    "highlight": _describe_highlight,
+    "circle": _describe_circle,
+    "label": _describe_label,
+    "callout_arrow": _describe_callout_arrow,
+}
+
+
 def guided_review_workflow(annotations_map: Dict, input_dir: Path) -> Dict:
     """
     Interactive guided review of annotation plans.
@@ -1490,55 +1850,45 @@ def guided_review_workflow(annotations_map: Dict, input_dir: Path) -> Dict:
 
     approved = {}
     approve_all = False
+    total = len(annotations_map)
+
+    # List the source directory once instead of probing each candidate name.
+    # Stems match exactly, as in process_directory; extensions match in any
+    # case ("step1.JPEG"), with an exact lowercase extension winning ties.
+    source_names = {}
+    if input_dir.is_dir():
+        with os.scandir(input_dir) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    stem, ext = os.path.splitext(entry.name)
+                    key = (stem, ext.lower())
+                    if ext == key[1] or key not in source_names:
+                        source_names[key] = entry.name
 
     for i, (image_stem, annotations) in enumerate(annotations_map.items(), 1):
         # Find source image
         source_path = None
-        for ext in [".png", ".jpg", ".jpeg", ".PNG", ".JPG"]:
-            candidate = input_dir / f"{image_stem}{ext}"
-            if candidate.exists():
-                source_path = candidate
+        for ext in [".png", ".jpg", ".jpeg"]:
+            name = source_names.get((image_stem, ext))
+            if name:
+                source_path = input_dir / name
                 break
 
         if not source_path:
-            print(
-                f"[{i}/{len(annotations_map)}] {image_stem}: Source not found, skipping"
-            )
+            print(f"[{i}/{total}] {image_stem}: Source not found, skipping")
             continue
 
-        # Display annotation summary
-        print(f"\n[{i}/{len(annotations_map)}] {image_stem}")
-        print("-" * 40)
-
+        # Display annotation summary, written in one go per image
+        lines = [f"\n[{i}/{total}] {image_stem}", "-" * 40]
         for j, ann in enumerate(annotations, 1):
             ann_type = ann.get("type", "unknown")
             color = ann.get("color", "teal")
-            pos = ann.get("position", {})
-
-            if ann_type == "callout":
-                num = ann.get("number", "?")
-                print(
-                    f"  {j}. Callout #{num} ({color}) at ({pos.get('x', '?')}%, {pos.get('y', '?')}%)"
-                )
-            elif ann_type == "arrow":
-                end = ann.get("end", {})
-                print(
-                    f"  {j}. Arrow ({color}) from ({pos.get('x')}%, {pos.get('y')}%) to ({end.get('x')}%, {end.get('y')}%)"
-                )
-            elif ann_type == "highlight":
-                bbox = ann.get("bbox", {})
-                print(
-                    f"  {j}. Highlight ({color}) box at ({bbox.get('x')}%, {bbox.get('y')}%) size {bbox.get('w')}x{bbox.get('h')}%"
-                )
-            elif ann_type == "circle":
-                print(f"  {j}. Circle ({color}) at ({pos.get('x')}%, {pos.get('y')}%)")
-            elif ann_type == "label":
-                text = ann.get("text", "")
-                print(
-                    f"  {j}. Label ({color}): \"{text}\" at ({pos.get('x')}%, {pos.get('y')}%)"
-                )
+            describe = _REVIEW_DESCRIBERS.get(ann_type)
+            if describe:
+                lines.append(f"  {j}. {describe(ann, color, ann.get('position', {}))}")
             else:
-                print(f"  {j}. {ann_type} ({color})")
+                lines.append(f"  {j}. {ann_type} ({color})")
+        print("\n".join(lines))
 
         # Auto-approve if user chose "All"
         if approve_all:
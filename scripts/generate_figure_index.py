@@ -9,9 +9,16 @@ Part of TFCU Procedure Formatter Skill v4.3
 import argparse
 import json
 import sys
+from collections import Counter
 from pathlib import Path
 from typing import Dict, List
 
+# Optional C JSON codec; falls back to the stdlib json module
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 def generate_index(registry_path: Path) -> Dict:
     """
@@ -28,20 +35,21 @@ def generate_index(registry_path: Path) -> Dict:
         - total_annotations: int
         - coverage_stats: {total, annotated, coverage_pct}
     """
-    with open(registry_path, encoding="utf-8") as f:
-        registry = json.load(f)
+    if orjson is not None:
+        registry = orjson.loads(Path(registry_path).read_bytes())
+    else:
+        with open(registry_path, encoding="utf-8") as f:
+            registry = json.load(f)
 
     figures_by_section = {}
-    annotation_counts = {
-        "callout": 0,
-        "arrow": 0,
-        "highlight": 0,
-        "circle": 0,
-        "label": 0,
-    }
+    annotation_counts = Counter(
+        {"callout": 0, "arrow": 0, "highlight": 0, "circle": 0, "label": 0}
+    )
+    annotated_figures = 0
 
     for fig in registry["figures"]:
         section = fig.get("section", "Uncategorized")
+        annotations = fig["annotations"]
         if section not in figures_by_section:
             figures_by_section[section] = []
 
@@ -50,30 +58,24 @@ def generate_index(registry_path: Path) -> Dict:
                 "figure_number": fig["figure_number"],
                 "source": Path(fig["source_image"]).name,
                 "annotated": Path(fig["annotated_image"]).name,
-                "annotation_count": len(fig["annotations"]),
-                "annotation_types": [a["type"] for a in fig["annotations"]],
+                "annotation_count": len(annotations),
+                "annotation_types": [a["type"] for a in annotations],
                 "legend_items": fig.get("legend", []),
             }
         )
 
-        # Count annotation types
-        for ann in fig["annotations"]:
-            ann_type = ann.get("type", "unknown")
-            if ann_type in annotation_counts:
-                annotation_counts[ann_type] += 1
-            else:
-                annotation_counts[ann_type] = 1
+        # Count annotation types (new types are appended in first-seen order)
+        annotation_counts.update(ann.get("type", "unknown") for ann in annotations)
+        if annotations:
+            annotated_figures += 1
 
     # Calculate coverage stats
     total_figures = registry["total_count"]
-    annotated_figures = sum(
-        1 for fig in registry["figures"] if len(fig["annotations"]) > 0
-    )
     coverage_pct = (annotated_figures / total_figures * 100) if total_figures > 0 else 0
 
     return {
         "figures_by_section": figures_by_section,
-        "annotation_summary": annotation_counts,
+        "annotation_summary": dict(annotation_counts),
         "total_figures": total_figures,
         "total_annotations": sum(annotation_counts.values()),
         "coverage_stats": {
@@ -117,8 +119,13 @@ def main():
 
     # Save to output
     output_path = Path(args.output)
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(index, f, indent=2, ensure_ascii=False)
+    if orjson is not None:
+        output_path.write_bytes(
+            orjson.dumps(index, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        )
+    else:
+        with open(output_path, "w", encoding="utf-8") as f:
+            json.dump(index, f, indent=2, ensure_ascii=False)
 
     # Print summary
     print("=" * 60)
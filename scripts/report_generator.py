@@ -11,11 +11,21 @@ Usage:
 """
 
 import argparse
+import functools
 import json
+import re
+import string
 import sys
+import types
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
+
+# Optional C JSON codec; falls back to the stdlib json module
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Import sibling modules if available
 try:
@@ -40,6 +50,18 @@ except ImportError:
     TextColorParser = None
 
 
+# _simple_parse tokens: "Figure N" (case-sensitive apart from the F), a
+# "(color type [N])" reference, or a line end. Separators are [^\S\n] so no
+# match spans lines.
+_SIMPLE_PARSE_PATTERN = re.compile(
+    r"(?-i:[Ff]igure)[^\S\n]+(\d+)"
+    rf"|\(({'|'.join(COLOR_PALETTE)})[^\S\n]+(?:callout|arrow|highlight|circle)"
+    r"(?:[^\S\n]+(\d+))?\)"
+    r"|\n|\Z",
+    re.IGNORECASE,
+)
+
+
 # =============================================================================
 # HTML TEMPLATE
 # =============================================================================
@@ -321,6 +343,99 @@ COLOR_ROW_TEMPLATE = """
 """
 
 
+class _CompiledTemplate:
+    """A str.format template parsed once into (literal, field) pieces.
+
+    Rendering just interleaves literals and field values, so large templates
+    (the CSS-heavy page, or rows rendered thousands of times) aren't rescanned
+    for fields and {{ }} escapes on every call. Only plain {name} fields are
+    supported, which is all the templates above use; anything else (format
+    specs, !r conversions, indexing) raises ValueError rather than rendering
+    differently from str.format.
+    """
+
+    def __init__(self, template: str):
+        self._parts = []
+        for literal, field, spec, conversion in string.Formatter().parse(template):
+            if field is not None and (spec or conversion or not field.isidentifier()):
+                raise ValueError(f"Unsupported template field: {field!r}")
+            self._parts.append((literal, field))
+
+    def format(self, **fields) -> str:
+        return "".join(
+            [
+                literal if field is None else literal + str(fields[field])
+                for literal, field in self._parts
+            ]
+        )
+
+    def iter_format(self, **fields) -> Iterator[str]:
+        """Like format(), but yield pieces; list/generator values yield per item."""
+        for literal, field in self._parts:
+            yield literal
+            if field is not None:
+                value = fields[field]
+                if isinstance(value, (list, types.GeneratorType)):
+                    yield from value
+                else:
+                    yield str(value)
+
+
+_HTML = _CompiledTemplate(HTML_TEMPLATE)
+
+# Palette legend is the same for every report; aliases are skipped
+_PALETTE_HTML = "\n".join(
+    f'<div class="palette-item">'
+    f'<div class="color-swatch" style="background: {hex_val};"></div>'
+    f"<span>{name}</span>"
+    f"</div>"
+    for name, hex_val in sorted(COLOR_PALETTE.items())
+    if name not in ("critical", "info", "warning", "success", "primary")
+)
+_COLOR_ROW = _CompiledTemplate(COLOR_ROW_TEMPLATE)
+
+# (status class, label) for a color row, keyed by its is_match flag
+_ROW_STATUS = {True: ("status-match", "Match"), False: ("status-mismatch", "Mismatch")}
+
+# Card halves around {rows}, so rows can be appended between them in place
+_card_head, _card_tail = FIGURE_CARD_TEMPLATE.split("{rows}")
+_FIGURE_CARD_HEAD = _CompiledTemplate(_card_head)
+# The tail has no fields but still needs its {{ }} escapes resolved
+_FIGURE_CARD_TAIL = _CompiledTemplate(_card_tail).format()
+del _card_head, _card_tail
+
+
+def _int_key(key):
+    """Return key as an int when it is numeric ("3" -> 3), else unchanged."""
+    try:
+        return int(key)
+    except (TypeError, ValueError):
+        return key
+
+
+# Palette names that count as the same color when comparing text vs image
+_COLOR_EQUIVALENTS = {
+    name: group
+    for group in (
+        frozenset({"red", "critical"}),
+        frozenset({"blue", "info"}),
+        frozenset({"gold", "warning", "yellow"}),
+        frozenset({"green", "success"}),
+        frozenset({"teal", "primary"}),
+    )
+    for name in group
+}
+
+
+# Color names come from a small palette, so nearly every call is a cache hit
+# and the case folding happens once per distinct (expected, actual) pair
+@functools.lru_cache(maxsize=256)
+def _colors_equivalent(expected: str, actual: str) -> bool:
+    expected = expected.lower()
+    actual = actual.lower()
+    return expected == actual or actual in _COLOR_EQUIVALENTS.get(expected, ())
+
+
 # =============================================================================
 # REPORT GENERATOR
 # =============================================================================
@@ -336,14 +451,18 @@ class ReportGenerator:
         self.expected_colors = {}
         self.matches = []
         self.mismatches = []
+        self.by_figure = {}  # {figure: {"matches": [...], "mismatches": [...]}}
 
     def load_registry(self, registry_path: Path) -> bool:
         """Load figure registry JSON file."""
         if not registry_path.exists():
             return False
 
-        with open(registry_path, encoding="utf-8") as f:
-            data = json.load(f)
+        if orjson is not None:
+            data = orjson.loads(registry_path.read_bytes())
+        else:
+            with open(registry_path, encoding="utf-8") as f:
+                data = json.load(f)
 
         self.figures = data.get("figures", [])
         self.color_map = data.get("color_map", {})
@@ -369,31 +488,30 @@ class ReportGenerator:
 
     def _simple_parse(self, text: str) -> Dict[int, Dict[int, str]]:
         """Simple color reference parsing without full TextColorParser."""
-        import re
-
         result = {}
         current_figure = None
 
-        color_names = "|".join(COLOR_PALETTE.keys())
-        pattern = re.compile(
-            rf"\(({color_names})\s+(?:callout|arrow|highlight|circle)(?:\s+(\d+))?\)",
-            re.IGNORECASE,
-        )
-        fig_pattern = re.compile(r"[Ff]igure\s+(\d+)")
-
-        for line in text.split("\n"):
-            fig_match = fig_pattern.search(line)
-            if fig_match:
-                current_figure = int(fig_match.group(1))
-
-            for match in pattern.finditer(line):
-                color = match.group(1).lower()
-                num = int(match.group(2)) if match.group(2) else 1
-
+        # One scan over the whole text. References wait in pending until
+        # their line ends, because the line's first figure mention applies
+        # to every reference on it, including earlier ones.
+        line_has_figure = False
+        pending = []
+        for match in _SIMPLE_PARSE_PATTERN.finditer(text):
+            fig, color, num = match.groups()
+            if fig:
+                if not line_has_figure:
+                    current_figure = int(fig)
+                    line_has_figure = True
+            elif color:
+                pending.append((color.lower(), int(num) if num else 1))
+            else:
                 if current_figure:
-                    if current_figure not in result:
-                        result[current_figure] = {}
-                    result[current_figure][num] = color
+                    for ref_color, ref_num in pending:
+                        if current_figure not in result:
+                            result[current_figure] = {}
+                        result[current_figure][ref_num] = ref_color
+                pending.clear()
+                line_has_figure = False
 
         return result
 
@@ -401,14 +519,22 @@ class ReportGenerator:
         """Compare expected vs actual colors."""
         self.matches = []
         self.mismatches = []
+        self.by_figure = {}
+
+        # Registry JSON keys figures and annotations as strings, an in-memory
+        # FigureRegistry as ints; normalize once so each row is one lookup
+        color_map = {
+            _int_key(fig_key): {
+                _int_key(ann_key): data for ann_key, data in anns.items()
+            }
+            for fig_key, anns in self.color_map.items()
+        }
 
         for fig_num, expected_anns in self.expected_colors.items():
-            fig_str = str(fig_num)
-            actual = self.color_map.get(fig_str, self.color_map.get(fig_num, {}))
+            actual = color_map.get(_int_key(fig_num), {})
 
             for ann_num, expected_color in expected_anns.items():
-                ann_str = str(ann_num)
-                actual_data = actual.get(ann_str, actual.get(ann_num))
+                actual_data = actual.get(_int_key(ann_num))
 
                 if actual_data:
                     actual_color = actual_data.get("color_name", "unknown")
@@ -426,110 +552,86 @@ class ReportGenerator:
                     "expected_hex": expected_hex,
                     "actual_color": actual_color,
                     "actual_hex": actual_hex,
+                    "is_match": self._colors_match(expected_color, actual_color),
                 }
 
-                if self._colors_match(expected_color, actual_color):
+                if fig_num not in self.by_figure:
+                    self.by_figure[fig_num] = {"matches": [], "mismatches": []}
+                if item["is_match"]:
                     self.matches.append(item)
+                    self.by_figure[fig_num]["matches"].append(item)
                 else:
                     self.mismatches.append(item)
+                    self.by_figure[fig_num]["mismatches"].append(item)
 
     def _colors_match(self, expected: str, actual: str) -> bool:
         """Check if colors match (including equivalents)."""
-        if expected.lower() == actual.lower():
-            return True
-
-        equivalents = {
-            "red": ["red", "critical"],
-            "critical": ["red", "critical"],
-            "blue": ["blue", "info"],
-            "info": ["blue", "info"],
-            "gold": ["gold", "warning", "yellow"],
-            "warning": ["gold", "warning", "yellow"],
-            "yellow": ["gold", "warning", "yellow"],
-            "green": ["green", "success"],
-            "success": ["green", "success"],
-            "teal": ["teal", "primary"],
-            "primary": ["teal", "primary"],
-        }
-
-        expected_equiv = equivalents.get(expected.lower(), [expected.lower()])
-        return actual.lower() in expected_equiv
+        return _colors_equivalent(expected, actual)
 
     def generate_html(self) -> str:
         """Generate HTML report."""
-        # Build figure cards
-        figures_by_num = {}
-        for item in self.matches + self.mismatches:
-            fig_num = item["figure"]
-            if fig_num not in figures_by_num:
-                figures_by_num[fig_num] = {"matches": [], "mismatches": []}
-
-            if item in self.matches:
-                figures_by_num[fig_num]["matches"].append(item)
-            else:
-                figures_by_num[fig_num]["mismatches"].append(item)
+        return "".join(self.iter_html())
+
+    def iter_html(self) -> Iterator[str]:
+        """Generate the HTML report as a stream of string pieces.
 
-        content_parts = []
+        Figure cards are rendered lazily, one card per step, as the stream
+        reaches the content section of the page.
+        """
+        # Calculate stats
+        total_annotations = sum(len(fig.get("annotations", [])) for fig in self.figures)
+
+        yield from _HTML.iter_format(
+            timestamp=datetime.now().strftime("%Y-%m-%d %H:%M"),
+            total_figures=len(self.figures),
+            total_annotations=total_annotations,
+            color_matches=len(self.matches),
+            color_mismatches=len(self.mismatches),
+            total_class="" if self.figures else "warning",
+            annotations_class="" if total_annotations else "warning",
+            matches_class="success" if self.matches else "",
+            mismatches_class="error" if self.mismatches else "success",
+            content=self._iter_content(),
+            palette_html=_PALETTE_HTML,
+        )
+
+    def _iter_content(self) -> Iterator[str]:
+        """Yield the report's content section, rendering each card on demand."""
+        # Figure cards, from the per-figure buckets built by compare_colors
+        figures_by_num = self.by_figure
 
         if self.mismatches:
-            content_parts.append("<h2>Color Mismatches</h2>")
+            yield "<h2>Color Mismatches</h2>"
             for fig_num in sorted(figures_by_num.keys()):
                 data = figures_by_num[fig_num]
                 if data["mismatches"]:
-                    content_parts.append(
-                        self._render_figure_card(fig_num, data, show_mismatches=True)
-                    )
+                    card = ["\n"]
+                    self._render_figure_card(card, fig_num, data, show_mismatches=True)
+                    yield from card
 
         if self.matches:
-            content_parts.append("<h2>Verified Matches</h2>")
+            if self.mismatches:
+                yield "\n"
+            yield "<h2>Verified Matches</h2>"
             for fig_num in sorted(figures_by_num.keys()):
                 data = figures_by_num[fig_num]
                 if data["matches"] and not data["mismatches"]:
-                    content_parts.append(
-                        self._render_figure_card(fig_num, data, show_mismatches=False)
-                    )
+                    card = ["\n"]
+                    self._render_figure_card(card, fig_num, data, show_mismatches=False)
+                    yield from card
 
         if not self.matches and not self.mismatches:
-            content_parts.append(
+            yield (
                 '<div class="no-issues">'
                 "<p>No color references found to validate.</p>"
                 "<p>Add color references like <code>(red callout 1)</code> to your procedure text.</p>"
                 "</div>"
             )
 
-        # Build palette HTML
-        palette_items = []
-        for name, hex_val in sorted(set(COLOR_PALETTE.items()), key=lambda x: x[0]):
-            if name in ["critical", "info", "warning", "success", "primary"]:
-                continue  # Skip aliases
-            palette_items.append(
-                f'<div class="palette-item">'
-                f'<div class="color-swatch" style="background: {hex_val};"></div>'
-                f"<span>{name}</span>"
-                f"</div>"
-            )
-
-        # Calculate stats
-        total_annotations = sum(len(fig.get("annotations", [])) for fig in self.figures)
-
-        return HTML_TEMPLATE.format(
-            timestamp=datetime.now().strftime("%Y-%m-%d %H:%M"),
-            total_figures=len(self.figures),
-            total_annotations=total_annotations,
-            color_matches=len(self.matches),
-            color_mismatches=len(self.mismatches),
-            total_class="" if self.figures else "warning",
-            annotations_class="" if total_annotations else "warning",
-            matches_class="success" if self.matches else "",
-            mismatches_class="error" if self.mismatches else "success",
-            content="\n".join(content_parts),
-            palette_html="\n".join(palette_items),
-        )
-
     def _render_figure_card(
-        self, fig_num: int, data: Dict, show_mismatches: bool
-    ) -> str:
-        """Render a single figure card."""
+        self, out: List[str], fig_num: int, data: Dict, show_mismatches: bool
+    ) -> None:
+        """Render a single figure card, appending its pieces to out."""
         items = data["mismatches"] if show_mismatches else data["matches"]
         all_items = data["matches"] + data["mismatches"]
 
@@ -540,33 +642,37 @@ class ReportGenerator:
             status_class = "status-match"
             status_text = "All colors match"
 
-        rows = []
-        for item in all_items:
-            is_match = item in data["matches"]
-            rows.append(
-                COLOR_ROW_TEMPLATE.format(
+        out.append(
+            _FIGURE_CARD_HEAD.format(
+                figure_num=fig_num,
+                status_class=status_class,
+                status_text=status_text,
+            )
+        )
+        # Row loop runs once per annotation; keep lookups in locals
+        append = out.append
+        render_row = _COLOR_ROW.format
+        for index, item in enumerate(all_items):
+            if index:
+                append("\n")
+            row_status_class, row_status = _ROW_STATUS[item["is_match"]]
+            append(
+                render_row(
                     num=item["annotation"],
                     expected_hex=item["expected_hex"],
                     expected_name=item["expected_color"],
                     actual_hex=item["actual_hex"],
                     actual_name=item["actual_color"],
-                    row_status_class="status-match" if is_match else "status-mismatch",
-                    row_status="Match" if is_match else "Mismatch",
+                    row_status_class=row_status_class,
+                    row_status=row_status,
                 )
             )
-
-        return FIGURE_CARD_TEMPLATE.format(
-            figure_num=fig_num,
-            status_class=status_class,
-            status_text=status_text,
-            rows="\n".join(rows),
-        )
+        append(_FIGURE_CARD_TAIL)
 
     def save_html(self, output_path: Path):
         """Save HTML report to file."""
-        html = self.generate_html()
         with open(output_path, "w", encoding="utf-8") as f:
-            f.write(html)
+            f.writelines(self.iter_html())
 
 
 # =============================================================================
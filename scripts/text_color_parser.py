@@ -16,7 +16,13 @@ import json
 import re
 import sys
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# Optional C JSON codec; falls back to the stdlib json module
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # =============================================================================
 # COLOR REFERENCE PATTERNS
@@ -97,6 +103,24 @@ CIRCLED_NUMBERS = {
 }
 CIRCLED_PATTERN = re.compile(r"([①②③④⑤⑥⑦⑧⑨⑩])")
 
+# Pattern: any palette color as a bare word
+COLOR_WORD_PATTERN = re.compile(rf"\b({COLOR_NAMES})\b", re.IGNORECASE)
+
+# Palette order decides which color wins when several are mentioned
+COLOR_PRIORITY = {color: rank for rank, color in enumerate(COLOR_PALETTE)}
+
+
+def _iter_lines(text: str) -> Iterator[str]:
+    """Yield the lines of text one at a time, exactly as text.split("\\n") would."""
+    start = 0
+    while True:
+        end = text.find("\n", start)
+        if end == -1:
+            yield text[start:]
+            return
+        yield text[start:end]
+        start = end + 1
+
 
 # =============================================================================
 # PARSER CLASS
@@ -154,8 +178,7 @@ class TextColorParser:
         self.by_figure = {}
         self.current_figure = None
 
-        lines = text.split("\n")
-        for line_num, line in enumerate(lines, 1):
+        for line_num, line in enumerate(_iter_lines(text), 1):
             self._parse_line(line, line_num)
 
         return self.references
@@ -208,8 +231,7 @@ class TextColorParser:
             num = CIRCLED_NUMBERS.get(circled)
             if num:
                 # Check for color context before the circled number
-                before = line[: match.start()]
-                color_context = self._find_color_context(before)
+                color_context = self._find_color_context(line, match.start())
                 if color_context:
                     self._add_reference(
                         color=color_context,
@@ -220,12 +242,17 @@ class TextColorParser:
                         context=line.strip(),
                     )
 
-    def _find_color_context(self, text: str) -> Optional[str]:
-        """Find color mentioned in text context."""
-        for color in COLOR_PALETTE.keys():
-            if re.search(rf"\b{color}\b", text, re.IGNORECASE):
-                return color
-        return None
+    def _find_color_context(
+        self, text: str, end: Optional[int] = None
+    ) -> Optional[str]:
+        """Find color mentioned in text context, optionally only before ``end``."""
+        if end is None:
+            end = len(text)
+        found = {
+            match.group(1).lower()
+            for match in COLOR_WORD_PATTERN.finditer(text, 0, end)
+        }
+        return min(found, key=COLOR_PRIORITY.__getitem__, default=None)
 
     def _add_reference(
         self,
@@ -376,9 +403,22 @@ Examples:
                 num_str = f" {ref['number']}" if ref["number"] else ""
                 print(f"    - {ref['color']} {ref['annotation_type']}{num_str}")
     elif args.output:
-        with open(args.output, "w", encoding="utf-8") as f:
-            json.dump(result, f, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            args.output.write_bytes(
+                orjson.dumps(
+                    result, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                )
+            )
+        else:
+            with open(args.output, "w", encoding="utf-8") as f:
+                json.dump(result, f, indent=2, ensure_ascii=False)
         print(f"Saved to: {args.output}")
+    elif orjson is not None:
+        print(
+            orjson.dumps(
+                result, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            ).decode()
+        )
     else:
         print(json.dumps(result, indent=2, ensure_ascii=False))
 
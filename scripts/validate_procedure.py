@@ -66,6 +66,18 @@ class ColorConsistencyValidator:
         "orange": ["orange"],
     }
 
+    # Tokens for _parse_expected_colors: "Figure N" (case-sensitive apart
+    # from the F), a "(red callout 1)" reference, or a line end. Separators
+    # are [^\S\n] so no match spans lines.
+    EXPECTED_COLOR_PATTERN = re.compile(
+        r"(?-i:[Ff]igure)[^\S\n]+(\d+)"
+        rf"|\(({'|'.join(COLOR_PALETTE)})[^\S\n]+"
+        r"(?:callout|arrow|highlight|circle|box|label|marker|number)"
+        r"(?:[^\S\n]+(\d+))?\)"
+        r"|\n|\Z",
+        re.IGNORECASE,
+    )
+
     def __init__(self, verbose: bool = False):
         """Initialize validator."""
         self.verbose = verbose
@@ -172,34 +184,27 @@ class ColorConsistencyValidator:
         result = {}
         current_figure = None
 
-        # Color and annotation type patterns
-        color_names = "|".join(self.COLOR_PALETTE.keys())
-        ann_types = "callout|arrow|highlight|circle|box|label|marker|number"
-
-        # Pattern: "(red callout 1)"
-        pattern = re.compile(
-            rf"\(({color_names})\s+({ann_types})(?:\s+(\d+))?\)",
-            re.IGNORECASE,
-        )
-
-        # Figure reference pattern
-        fig_pattern = re.compile(r"[Ff]igure\s+(\d+)")
-
-        for line in text.split("\n"):
-            # Update figure context
-            fig_match = fig_pattern.search(line)
-            if fig_match:
-                current_figure = int(fig_match.group(1))
-
-            # Find color references
-            for match in pattern.finditer(line):
-                color = match.group(1).lower()
-                ann_num = int(match.group(3)) if match.group(3) else 1
-
+        # One scan over the whole text. References wait in pending until
+        # their line ends, because the line's first figure mention applies
+        # to every reference on it, including earlier ones.
+        line_has_figure = False
+        pending = []
+        for match in self.EXPECTED_COLOR_PATTERN.finditer(text):
+            fig, color, num = match.groups()
+            if fig:
+                if not line_has_figure:
+                    current_figure = int(fig)
+                    line_has_figure = True
+            elif color:
+                pending.append((color.lower(), int(num) if num else 1))
+            else:
                 if current_figure:
-                    if current_figure not in result:
-                        result[current_figure] = {}
-                    result[current_figure][ann_num] = color
+                    for ann_color, ann_num in pending:
+                        if current_figure not in result:
+                            result[current_figure] = {}
+                        result[current_figure][ann_num] = ann_color
+                pending.clear()
+                line_has_figure = False
 
         return result
 
@@ -236,6 +241,9 @@ class ColorConsistencyValidator:
 # MAIN VALIDATION
 # =============================================================================
 
+# Figure mention as written in procedure text: "Figure 3", "fig. 3", ...
+FIGURE_MENTION_PATTERN = re.compile(r"(?:[Ff]igure|[Ff]ig\.) (\d+)")
+
 
 def validate(
     doc_path: Path,
@@ -286,19 +294,18 @@ def validate(
         if section not in doc_content:
             errors.append(f"MISSING SECTION: {section}")
 
-    # Check figure references
+    # Check figure references. One pass collects every digit prefix that
+    # follows a figure mention; prefixes keep the substring semantics, so
+    # "Figure 12" still counts as a mention of Figure 1.
+    referenced_numbers = set()
+    for match in FIGURE_MENTION_PATTERN.finditer(doc_content):
+        digits = match.group(1)
+        referenced_numbers.update(digits[:end] for end in range(1, len(digits) + 1))
+
     for section_name, figures in fig_index.get("figures_by_section", {}).items():
         for fig in figures:
             fig_num = fig["figure_number"]
-            fig_ref_patterns = [
-                f"Figure {fig_num}",
-                f"figure {fig_num}",
-                f"Fig. {fig_num}",
-                f"fig. {fig_num}",
-            ]
-
-            referenced = any(pattern in doc_content for pattern in fig_ref_patterns)
-            if not referenced:
+            if str(fig_num) not in referenced_numbers:
                 warnings.append(
                     f"Figure {fig_num} ({fig['source']}) not referenced in document text"
                 )
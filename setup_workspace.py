@@ -11,6 +11,7 @@ Works on Windows, macOS, and Linux.
 """
 
 import argparse
+import os
 import shutil
 import subprocess
 import sys
@@ -109,10 +110,12 @@ def setup_workspace(source_docx: Path, workspace: Path = None, verbose: bool = T
     media_dir = extract_dir / "word" / "media"
     if media_dir.exists():
         image_count = 0
-        for img_file in media_dir.iterdir():
-            if img_file.is_file():
-                shutil.copy(img_file, raw_dir / img_file.name)
-                image_count += 1
+        # scandir reuses the dirent type, avoiding a stat() per media file
+        with os.scandir(media_dir) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    shutil.copy(entry.path, raw_dir / entry.name)
+                    image_count += 1
 
         if verbose:
             print(f"\n✓ Copied {image_count} images to: {raw_dir}")
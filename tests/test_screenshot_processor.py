@@ -0,0 +1,78 @@
+"""Checks for screenshot_processor. Run from the repo root:
+
+python -m unittest discover tests
+"""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from PIL import Image
+
+from screenshot_processor import (
+    _REVIEW_DESCRIBERS,
+    FigureRegistry,
+    ScreenshotAnnotator,
+    process_directory,
+)
+
+CALLOUT_ARROW_ANNOTATIONS = [
+    {
+        "type": "callout",
+        "position": {"x": 25, "y": 30},
+        "number": 1,
+        "color": "#C00000",
+        "description": "Open the menu",
+    },
+    {
+        "type": "callout_arrow",
+        "start": {"x": 80, "y": 80},
+        "position": {"x": 60, "y": 40},
+        "number": 2,
+        "color": "#2E74B5",
+        "description": "Pick the account",
+    },
+]
+
+
+class CalloutArrowTest(unittest.TestCase):
+    def test_renders_onto_image(self):
+        image = Image.new("RGB", (400, 300), "white")
+        annotated = ScreenshotAnnotator().process_image(
+            image, CALLOUT_ARROW_ANNOTATIONS[1:]
+        )
+        self.assertEqual(annotated.size, (400, 300))
+        # Callout circle at (60%, 40%) is filled with the annotation color
+        self.assertEqual(annotated.getpixel((240, 120))[:3], (46, 116, 181))
+
+    def test_gets_legend_entry(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            input_dir = Path(tmp) / "raw"
+            output_dir = Path(tmp) / "annotated"
+            input_dir.mkdir()
+            output_dir.mkdir()
+            Image.new("RGB", (400, 300), "white").save(input_dir / "step1.png")
+
+            registry = FigureRegistry()
+            process_directory(
+                input_dir,
+                output_dir,
+                {"step1": CALLOUT_ARROW_ANNOTATIONS},
+                registry,
+            )
+
+            figure = registry.get_figure(1)
+            self.assertEqual([item["number"] for item in figure["legend"]], [1, 2])
+            self.assertEqual(sorted(figure["color_map"]), [1, 2])
+            self.assertTrue(Path(figure["annotated_image"]).exists())
+
+    def test_review_description(self):
+        ann = CALLOUT_ARROW_ANNOTATIONS[1]
+        line = _REVIEW_DESCRIBERS["callout_arrow"](ann, "blue", ann["position"])
+        self.assertEqual(
+            line, "Callout #2 (blue) at (60%, 40%) with arrow from (80%, 80%)"
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()